@@ -3,8 +3,9 @@ Flask API Server for Hoppr AI Integration
 Provides REST endpoints for DICOM analysis using Hoppr AI
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, stream_with_context
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
 from hoppr_model import HopprModelInterface
 from pathology_utils import (
     detect_pathology_from_filename,
@@ -14,55 +15,463 @@ from pathology_utils import (
     get_pathology_display_name
 )
 import os
-import tempfile
+import time
+import queue
+import heapq
+import atexit
+import hashlib
+import logging
+import logging.handlers
+import orjson
+import threading
+from collections import OrderedDict
+from operator import itemgetter
 from dotenv import load_dotenv
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 
 # Load environment variables
 load_dotenv()
 
+# Log through a queue so worker threads never block on the console;
+# a single listener thread does the actual writes
+logger = logging.getLogger("hoppr")
+_log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
+_log_level_valid = isinstance(logging.getLevelName(_log_level), int)
+logger.setLevel(_log_level if _log_level_valid else logging.INFO)
+_log_queue = queue.Queue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    '%(asctime)s %(levelname)s %(threadName)s %(name)s: %(message)s'
+))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+if not _log_level_valid:
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", _log_level)
+
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend requests
 
+# Reject oversized uploads before they are spooled to disk
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_UPLOAD_MB', 100)) * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Stop the model sweep once a model scores at least this high
+DEFAULT_EARLY_EXIT_THRESHOLD = 0.9
+# Skip the sweep when the model named in the filename scores at least this high
+FILENAME_HINT_THRESHOLD = 0.85
+# Seconds to wait for one model, and for a whole sweep, before giving up on
+# stragglers; keep the budget below the gunicorn worker timeout
+PER_MODEL_TIMEOUT = float(os.environ.get('HOPPR_MODEL_TIMEOUT', 60))
+ANALYSIS_TIME_BUDGET = float(os.environ.get('ANALYSIS_TIME_BUDGET', 90))
+# Threads shared by every parallel sweep in the process; the default leaves
+# room for about four sweeps running at once
+POOL_SIZE = int(os.environ.get('HOPPR_POOL_SIZE', len(PATHOLOGY_TO_MODEL) * 4))
+
 # Initialize Hoppr model
 hoppr_model = HopprModelInterface()
 
+# Open pooled Hoppr connections in the background so the first analysis
+# skips the TCP/TLS handshakes
+if os.environ.get('HOPPR_WARMUP', 'true').lower() == 'true':
+    threading.Thread(
+        target=hoppr_model.warm_up,
+        args=(len(PATHOLOGY_TO_MODEL),),
+        name="hoppr-warmup",
+        daemon=True
+    ).start()
+
+# In-memory LRU cache of model results keyed by (file sha256, model_id)
+RESULT_CACHE_SIZE = 512
+_result_cache = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# Worker pool shared by the parallel sweeps of all requests
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=POOL_SIZE,
+    thread_name_prefix="hoppr"
+)
+atexit.register(EXECUTOR.shutdown)
+
+# Let orjson handle non-string keys and numpy values in Hoppr payloads
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def ojson(obj, status=200):
+    """Build a JSON response with orjson, which is much faster than jsonify"""
+    return Response(
+        orjson.dumps(obj, option=ORJSON_OPTIONS),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+# Constant health check body, serialized once
+_HEALTH_BODY = orjson.dumps({
+    'status': 'healthy',
+    'service': 'Hoppr AI API',
+    'version': '1.0.0'
+})
+
+# Serialized /api/models body and its expiry (time.monotonic)
+MODELS_CACHE_TTL = 300
+_models_response = (0.0, None)
+
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'Hoppr AI API',
-        'version': '1.0.0'
-    })
+    return Response(_HEALTH_BODY, mimetype='application/json')
+
 
+class _SharedStudy:
+    """
+    A Hoppr study for one uploaded DICOM, created lazily and at most once.
 
-def analyze_single_pathology(temp_path, pathology, model_id):
-    """Helper function to analyze a single pathology model"""
+    Every model run for a request shares this study, so the image is uploaded
+    a single time and only the inference calls fan out. Nothing is uploaded
+    if every model result is already cached.
+    """
+
+    def __init__(self, image_data):
+        self._image_data = image_data
+        self._lock = threading.Lock()
+        self._ids = None
+        self._error = None
+
+    def ids(self):
+        """Return (study_id, image_id), uploading the image on first use"""
+        with self._lock:
+            if self._ids is None and self._error is None:
+                try:
+                    self._ids = hoppr_model.create_study_with_image(self._image_data)
+                except Exception as e:
+                    self._error = e
+            if self._error is not None:
+                raise self._error
+            return self._ids
+
+
+def _cached_analyze(digest, model_id, study, timeout=PER_MODEL_TIMEOUT, stop=None):
+    """
+    Run a Hoppr model on a DICOM file, reusing earlier results for the same file.
+
+    study is the request's _SharedStudy. Results are keyed on (digest, model_id)
+    only, and only successful results are cached. stop is an optional
+    threading.Event; once it is set, cache misses return None instead of
+    calling Hoppr.
+    """
+    key = (digest, model_id)
+    with _result_cache_lock:
+        cached = _result_cache.get(key)
+        if cached is not None:
+            _result_cache.move_to_end(key)
+            return dict(cached)
+
+    if stop is not None and stop.is_set():
+        return None
     try:
-        result = hoppr_model.analyze_dicom_image(
-            dicom_file_path=temp_path,
-            model_id=model_id
-        )
+        study_id, image_id = study.ids()
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e)
+        }
+    if stop is not None and stop.is_set():
+        return None
+    result = hoppr_model.run_inference(study_id, image_id, model_id, timeout=timeout)
 
-        if result.get('success'):
-            score = result.get('results', {}).get('response', {}).get('score', 0)
-            print(f"  → {pathology}: {score:.3f}")
+    if result.get('success'):
+        with _result_cache_lock:
+            _result_cache[key] = result
+            _result_cache.move_to_end(key)
+            while len(_result_cache) > RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+        # Callers annotate the returned dict, so hand out a copy
+        return dict(result)
+    return result
+
+
+def _score(result, _get=dict.get):
+    """Extract results.response.score from a Hoppr result, defaulting to 0"""
+    return _get(_get(_get(result, 'results') or {}, 'response') or {}, 'score', 0)
+
+
+def _timed_out(pathology):
+    """Placeholder result for a model that did not answer in time"""
+    return {
+        'pathology': pathology,
+        'score': 0,
+        'timed_out': True
+    }
+
+
+def _is_hit(result, threshold):
+    """True if a result is confident enough to end the sweep early"""
+    return not result.get('timed_out') and result['score'] >= threshold
+
+
+def analyze_single_pathology(study, digest, pathology, model_id, deadline=None, stop=None):
+    """
+    Helper function to analyze a single pathology model
+
+    The model gets PER_MODEL_TIMEOUT, cut down to what is left before deadline
+    (a time.monotonic() value) at the moment the task starts, so a pool
+    worker never outlives the request's time budget.
+    """
+    try:
+        timeout = PER_MODEL_TIMEOUT
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                logger.warning("  → %s: TIMED OUT", pathology)
+                return _timed_out(pathology)
+        result = _cached_analyze(digest, model_id, study, timeout=timeout, stop=stop)
+
+        if result is None:
+            logger.debug("  → %s: SKIPPED", pathology)
+            return None
+        elif result.get('success'):
+            score = _score(result)
+            logger.debug("  → %s: %.3f", pathology, score)
             return {
                 'pathology': pathology,
                 'score': score,
                 'result': result
             }
+        elif result.get('timed_out'):
+            logger.warning("  → %s: TIMED OUT", pathology)
+            return _timed_out(pathology)
         else:
-            print(f"  → {pathology}: FAILED")
+            logger.warning("  → %s: FAILED", pathology)
             return None
     except Exception as e:
-        print(f"  → {pathology}: ERROR - {e}")
+        logger.warning("  → %s: ERROR - %s", pathology, e)
         return None
 
 
+def _read_upload(dicom_file):
+    """
+    Return (sha256 digest, raw bytes) for an uploaded DICOM.
+
+    The upload is read once, in chunks, and hashed on the way through.
+    Werkzeug has already spooled large uploads to disk, so no further copy
+    of the file is written.
+    """
+    stream = dicom_file.stream
+    stream.seek(0)
+    digest = hashlib.sha256()
+    chunks = []
+    while chunk := stream.read(UPLOAD_CHUNK_SIZE):
+        digest.update(chunk)
+        chunks.append(chunk)
+    return digest.hexdigest(), b''.join(chunks)
+
+
+def _best_match_result(all_results, filename):
+    """
+    Pick the highest-scoring result and annotate it with the top 5 scores.
+
+    Models that timed out are left out of the ranking and listed under
+    'timed_out'. Returns None if no model produced a result.
+    """
+    timed_out = [r['pathology'] for r in all_results if r.get('timed_out')]
+    all_results = [r for r in all_results if not r.get('timed_out')]
+    if not all_results:
+        return None
+
+    # Only the top 5 matches are reported, so skip sorting the rest
+    top_results = heapq.nlargest(5, all_results, key=itemgetter('score'))
+    best_match = top_results[0]
+
+    logger.info("Best match: %s (%.3f)", best_match['pathology'], best_match['score'])
+
+    # Add metadata about other findings
+    best_result = best_match['result']
+    best_result['filename'] = filename
+    best_result['all_scores'] = {
+        r['pathology']: r['score']
+        for r in top_results
+    }
+    if timed_out:
+        best_result['timed_out'] = timed_out
+    if best_match.get('hint_source'):
+        best_result['hint_source'] = best_match['hint_source']
+    return best_result
+
+
+def _no_match_error(all_results):
+    """
+    Error body and HTTP status for a sweep in which no model succeeded.
+
+    If any model ran out of time the answer is a 504 listing them under
+    'timed_out'; otherwise every model failed outright and it is a 500.
+    """
+    timed_out = [r['pathology'] for r in all_results if r.get('timed_out')]
+    if timed_out:
+        return {
+            'success': False,
+            'error': 'Models timed out before any returned a result',
+            'timed_out': timed_out
+        }, 504
+    return {
+        'success': False,
+        'error': 'All models failed to analyze the image'
+    }, 500
+
+
+def _sweep(study, digest, filename, threshold, use_parallel):
+    """
+    Run the pathology models for one upload, yielding each result as it arrives.
+
+    The pathology named in the filename, if any, runs first. When it scores at
+    least FILENAME_HINT_THRESHOLD (or threshold, if lower) the sweep ends there
+    and its result is marked hint_source='filename'. Otherwise the remaining
+    models run on EXECUTOR or one by one, stopping at the first score at or
+    above threshold. Models that miss the time budget are yielded as
+    _timed_out placeholders; failed models are skipped. Once the sweep ends,
+    workers still queued or running skip their remaining Hoppr calls.
+    """
+    # Per-request stop flag: pool workers check it before each Hoppr call
+    stop = threading.Event()
+    # One time budget for the whole sweep, filename hint included
+    deadline = time.monotonic() + ANALYSIS_TIME_BUDGET
+    try:
+        pathologies = get_all_pathologies()
+
+        # Try the pathology named in the filename before sweeping every model
+        hinted = detect_pathology_from_filename(filename, default=None)
+        if hinted:
+            logger.info("Filename suggests %s, trying it first", hinted)
+            result = analyze_single_pathology(
+                study, digest, hinted, PATHOLOGY_TO_MODEL[hinted],
+                deadline=deadline,
+                stop=stop
+            )
+            if result is not None:
+                if _is_hit(result, min(FILENAME_HINT_THRESHOLD, threshold)):
+                    result['hint_source'] = 'filename'
+                    yield result
+                    return
+                yield result
+            pathologies = [p for p in pathologies if p != hinted]
+
+        logger.info(
+            "Analyzing DICOM file with all models: %s (mode: %s)",
+            filename,
+            'PARALLEL' if use_parallel else 'SEQUENTIAL'
+        )
+
+        if use_parallel:
+            # Parallel execution on the shared executor
+            logger.debug("Running parallel analysis of %d models...", len(pathologies))
+
+            # Submit all tasks
+            future_to_pathology = {
+                EXECUTOR.submit(
+                    analyze_single_pathology,
+                    study,
+                    digest,
+                    pathology,
+                    PATHOLOGY_TO_MODEL[pathology],
+                    deadline=deadline,
+                    stop=stop
+                ): pathology
+                for pathology in pathologies
+            }
+
+            # Collect results as they complete, within the time budget
+            pending = dict(future_to_pathology)
+            try:
+                remaining = max(0, deadline - time.monotonic())
+                for future in as_completed(future_to_pathology, timeout=remaining):
+                    del pending[future]
+                    result = future.result()
+                    if result is not None:
+                        if _is_hit(result, threshold):
+                            # Confident hit: drop models that have not started yet
+                            # and tell the running ones to skip their Hoppr calls
+                            stop.set()
+                            for pending in future_to_pathology:
+                                pending.cancel()
+                            yield result
+                            return
+                        yield result
+            except FuturesTimeoutError:
+                # Out of time: answer with whatever has arrived, including
+                # models that finished just as the budget ran out
+                stop.set()
+                for future, pathology in pending.items():
+                    if future.done():
+                        result = future.result()
+                        if result is not None:
+                            yield result
+                    else:
+                        future.cancel()
+                        yield _timed_out(pathology)
+        else:
+            # Sequential execution (original behavior)
+            for pathology in pathologies:
+                model_id = PATHOLOGY_TO_MODEL[pathology]
+                logger.debug("Testing %s...", pathology)
+
+                result = analyze_single_pathology(
+                    study, digest, pathology, model_id,
+                    deadline=deadline,
+                    stop=stop
+                )
+                if result is not None:
+                    yield result
+                    if _is_hit(result, threshold):
+                        return
+    finally:
+        # Also covers a streaming client disconnecting mid-sweep
+        stop.set()
+
+
+def _stream_analysis(dicom_file, threshold, use_parallel):
+    """
+    Run the model sweep and yield NDJSON records as models finish.
+
+    Each finished model yields {"type": "score", "pathology", "score",
+    "timed_out"}; the last line is the best-match result with
+    "type": "best_match", or an {"type": "error"} record if nothing succeeded
+    (listing 'timed_out' models, as the 504 response does).
+    """
+    try:
+        digest, image_data = _read_upload(dicom_file)
+        study = _SharedStudy(image_data)
+
+        all_results = []
+        for result in _sweep(study, digest, dicom_file.filename, threshold, use_parallel):
+            all_results.append(result)
+            yield orjson.dumps({
+                'type': 'score',
+                'pathology': result['pathology'],
+                'score': result['score'],
+                'timed_out': result.get('timed_out', False)
+            }, option=ORJSON_OPTIONS) + b"\n"
+
+        best_result = _best_match_result(all_results, dicom_file.filename)
+        if best_result is None:
+            error, _ = _no_match_error(all_results)
+            error['type'] = 'error'
+            yield orjson.dumps(error) + b"\n"
+            return
+
+        best_result['type'] = 'best_match'
+        yield orjson.dumps(best_result, option=ORJSON_OPTIONS) + b"\n"
+
+    except Exception as e:
+        logger.exception("Error streaming DICOM analysis")
+        yield orjson.dumps({
+            'type': 'error',
+            'success': False,
+            'error': str(e)
+        }) + b"\n"
+
+
 @app.route('/api/analyze', methods=['POST'])
 def analyze_dicom():
     """
@@ -77,6 +486,17 @@ def analyze_dicom():
         - DICOM file in request.files['dicom']
         - Optional model_id in request.form (for specific model)
         - Optional parallel in request.form ('true' for parallel execution)
+        - Optional early_exit_threshold in request.form (default 0.9, must be
+          in (0, 1]); the sweep stops once any model scores at or above it
+        - Optional stream in request.form ('true' to receive
+          application/x-ndjson records as each model finishes)
+
+    Models slower than HOPPR_MODEL_TIMEOUT, or still running when the sweep
+    exceeds ANALYSIS_TIME_BUDGET, are abandoned and listed under 'timed_out'.
+    If no model succeeded and some timed out, the response is a 504.
+
+    If the filename names a pathology, that model runs first and the sweep is
+    skipped when it is confident; the response then has hint_source='filename'.
 
     Returns:
         JSON with analysis results from the best-matching model
@@ -84,144 +504,109 @@ def analyze_dicom():
     try:
         # Check if file is present
         if 'dicom' not in request.files:
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'No DICOM file provided'
-            }), 400
+            }, 400)
 
         dicom_file = request.files['dicom']
 
         if dicom_file.filename == '':
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'Empty filename'
-            }), 400
-
-        # Save file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.dcm') as temp_file:
-            dicom_file.save(temp_file.name)
-            temp_path = temp_file.name
+            }, 400)
 
         try:
-            # Check if specific model was requested
-            model_id = request.form.get('model_id')
-
-            if model_id:
-                # Use specific model
-                print(f"Analyzing with specified model: {model_id}")
-                results = hoppr_model.analyze_dicom_image(
-                    dicom_file_path=temp_path,
-                    model_id=model_id
-                )
-                results['filename'] = dicom_file.filename
-                return jsonify(results)
-
-            # Check if parallel execution was requested
-            use_parallel = request.form.get('parallel', '').lower() == 'true'
-
-            print(f"Analyzing DICOM file with all models: {dicom_file.filename}")
-            print(f"Mode: {'PARALLEL' if use_parallel else 'SEQUENTIAL'}")
-            print("=" * 50)
-
-            all_results = []
-            pathologies = get_all_pathologies()
-
-            if use_parallel:
-                # Parallel execution with ThreadPoolExecutor
-                print(f"Running parallel analysis with {min(4, len(pathologies))} workers...")
-
-                with ThreadPoolExecutor(max_workers=4) as executor:
-                    # Submit all tasks
-                    future_to_pathology = {
-                        executor.submit(
-                            analyze_single_pathology,
-                            temp_path,
-                            pathology,
-                            PATHOLOGY_TO_MODEL[pathology]
-                        ): pathology
-                        for pathology in pathologies
-                    }
-
-                    # Collect results as they complete
-                    for future in as_completed(future_to_pathology):
-                        result = future.result()
-                        if result is not None:
-                            all_results.append(result)
-            else:
-                # Sequential execution (original behavior)
-                for pathology in pathologies:
-                    model_id = PATHOLOGY_TO_MODEL[pathology]
-                    print(f"Testing {pathology}...")
-
-                    result = analyze_single_pathology(temp_path, pathology, model_id)
-                    if result is not None:
-                        all_results.append(result)
-
-            if not all_results:
-                return jsonify({
-                    'success': False,
-                    'error': 'All models failed to analyze the image'
-                }), 500
-
-            # Sort by score and get the best match
-            all_results.sort(key=lambda x: x['score'], reverse=True)
-            best_match = all_results[0]
-
-            print("=" * 50)
-            print(f"Best match: {best_match['pathology']} ({best_match['score']:.3f})")
-            print("=" * 50)
-
-            # Add metadata about other findings
-            best_result = best_match['result']
-            best_result['filename'] = dicom_file.filename
-            best_result['all_scores'] = {
-                r['pathology']: r['score']
-                for r in all_results[:5]  # Top 5 matches
-            }
+            threshold = float(request.form.get(
+                'early_exit_threshold', DEFAULT_EARLY_EXIT_THRESHOLD
+            ))
+        except ValueError:
+            threshold = None
+        # Scores are probabilities; 0 or less would stop on any result at all,
+        # and NaN never compares true
+        if threshold is None or not 0 < threshold <= 1:
+            return ojson({
+                'success': False,
+                'error': 'early_exit_threshold must be a number in (0, 1]'
+            }, 400)
+
+        # Check if specific model was requested
+        model_id = request.form.get('model_id')
+
+        # Check if parallel execution was requested
+        use_parallel = request.form.get('parallel', '').lower() == 'true'
+
+        if not model_id and request.form.get('stream', '').lower() == 'true':
+            return Response(
+                stream_with_context(_stream_analysis(dicom_file, threshold, use_parallel)),
+                mimetype='application/x-ndjson'
+            )
+
+        digest, image_data = _read_upload(dicom_file)
+        # One Hoppr study per upload, shared by every model below
+        study = _SharedStudy(image_data)
+
+        if model_id:
+            # Use specific model
+            logger.info("Analyzing with specified model: %s", model_id)
+            results = _cached_analyze(digest, model_id, study)
+            results['filename'] = dicom_file.filename
+            return ojson(results)
+
+        all_results = list(
+            _sweep(study, digest, dicom_file.filename, threshold, use_parallel)
+        )
 
-            return jsonify(best_result)
+        best_result = _best_match_result(all_results, dicom_file.filename)
+        if best_result is None:
+            return ojson(*_no_match_error(all_results))
 
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        return ojson(best_result)
 
+    except RequestEntityTooLarge:
+        return ojson({
+            'success': False,
+            'error': 'DICOM file too large'
+        }, 413)
     except Exception as e:
-        print(f"Error analyzing DICOM: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({
+        logger.exception("Error analyzing DICOM")
+        return ojson({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 @app.route('/api/models', methods=['GET'])
 def get_models():
     """Get list of available Hoppr AI models"""
+    global _models_response
     try:
-        models = hoppr_model.get_available_models()
-        return jsonify({
-            'success': True,
-            'models': models
-        })
+        expires, body = _models_response
+        now = time.monotonic()
+        if body is None or now >= expires:
+            # The model list rarely changes; re-serialize at most once per TTL
+            models = hoppr_model.get_available_models()
+            body = orjson.dumps({
+                'success': True,
+                'models': models
+            })
+            _models_response = (now + MODELS_CACHE_TTL, body)
+        return Response(body, mimetype='application/json')
     except Exception as e:
-        return jsonify({
+        return ojson({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 
 if __name__ == '__main__':
-    import os
+    # Flask development server; production runs wsgi:application under gunicorn
     port = int(os.environ.get('PORT', 5001))
 
-    print("=" * 50)
-    print("Starting HOPPR AI API Server")
-    print("=" * 50)
-    print(f"API URL: http://localhost:{port}")
-    print(f"Health Check: http://localhost:{port}/api/health")
-    print(f"Analyze Endpoint: POST http://localhost:{port}/api/analyze")
-    print("=" * 50)
+    logger.info("Starting HOPPR AI API Server (development server)")
+    logger.info("API URL: http://localhost:%d", port)
+    logger.info("Health Check: http://localhost:%d/api/health", port)
+    logger.info("Analyze Endpoint: POST http://localhost:%d/api/analyze", port)
 
-    app.run(debug=False, port=port, host='0.0.0.0')
+    app.run(debug=False, threaded=True, port=port, host='0.0.0.0')
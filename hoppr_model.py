@@ -3,15 +3,54 @@ Hoppr AI Model Integration for DICOM Image Analysis
 This module provides a simple interface to analyze DICOM images using Hoppr AI models.
 """
 
+import hopprai
 from hopprai import HOPPR
 import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-from typing import Optional, Dict, Any
+import uuid
+import logging
+from typing import Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+logger = logging.getLogger("hoppr.model")
+
+# Default per-request HTTP timeout (seconds) for every Hoppr call
+HTTP_TIMEOUT = float(os.getenv("HOPPR_HTTP_TIMEOUT", 30))
+
+
+class _TimeoutSession(requests.Session):
+    """requests.Session that applies a default timeout to every request."""
+
+    def __init__(self, timeout: float):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, *args, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(*args, **kwargs)
+
+
+# Pooled keep-alive session shared by every Hoppr call in the process
+SESSION = _TimeoutSession(HTTP_TIMEOUT)
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# The SDK calls requests.get/post/delete at module level and takes no session,
+# so route those calls through the shared session once, here
+hopprai.requests = SESSION
+
 
 class HopprModelInterface:
     """Interface for interacting with Hoppr AI models for radiology analysis."""
@@ -33,6 +72,9 @@ class HopprModelInterface:
         else:
             self.hoppr = HOPPR(api_key=self.api_key)
 
+        # Every instance shares the module's pooled session
+        self._session = SESSION
+
     def analyze_dicom_image(
         self,
         dicom_file_path: str,
@@ -59,32 +101,136 @@ class HopprModelInterface:
             image_reference = f"image-{os.path.basename(dicom_file_path)}"
 
         try:
-            # Create a study
-            print(f"Creating study: {study_reference}")
-            study = self.hoppr.create_study(study_reference)
-            print(f"✓ Created study with ID: {study.id}")
-
-            # Read and add the DICOM image
-            print(f"Reading DICOM file: {dicom_file_path}")
+            # Read the DICOM image
+            logger.debug("Reading DICOM file: %s", dicom_file_path)
             with open(dicom_file_path, "rb") as f:
                 image_data = f.read()
+        except FileNotFoundError:
+            return {
+                "success": False,
+                "error": f"DICOM file not found: {dicom_file_path}"
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+        return self.analyze_dicom_bytes(
+            image_data,
+            model_id=model_id,
+            study_reference=study_reference,
+            image_reference=image_reference
+        )
+
+    def analyze_dicom_bytes(
+        self,
+        image_data: bytes,
+        model_id: str = "mc_chestradiography_atelectasis:v1.20250828",
+        study_reference: Optional[str] = None,
+        image_reference: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze an in-memory DICOM image using the specified Hoppr AI model.
 
-            print(f"Adding image to study: {image_reference}")
-            image = self.hoppr.add_study_image(study.id, image_reference, image_data)
-            print(f"✓ Added image with ID: {image.id}")
+        Args:
+            image_data: Raw bytes of the DICOM file.
+            model_id: The Hoppr model ID to use for inference.
+            study_reference: Optional custom study reference ID.
+            image_reference: Optional custom image reference ID.
 
+        Returns:
+            Dictionary containing the analysis results from the model.
+        """
+        try:
+            study_id, image_id = self.create_study_with_image(
+                image_data,
+                study_reference=study_reference,
+                image_reference=image_reference
+            )
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+        return self.run_inference(study_id, image_id, model_id)
+
+    def create_study_with_image(
+        self,
+        image_data: bytes,
+        study_reference: Optional[str] = None,
+        image_reference: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Create a study and upload a DICOM image to it.
+
+        The returned study can be passed to run_inference any number of times,
+        so several models can analyze one upload.
+
+        Args:
+            image_data: Raw bytes of the DICOM file.
+            study_reference: Optional custom study reference ID.
+            image_reference: Optional custom image reference ID.
+
+        Returns:
+            Tuple of (study_id, image_id).
+
+        Raises:
+            RuntimeError: If Hoppr rejects the study or the upload.
+        """
+        # Generate default references if not provided
+        reference = uuid.uuid4().hex
+        if not study_reference:
+            study_reference = f"study-{reference}"
+        if not image_reference:
+            image_reference = f"image-{reference}"
+
+        # Create a study
+        logger.debug("Creating study: %s", study_reference)
+        study = self.hoppr.create_study(study_reference)
+        logger.debug("✓ Created study with ID: %s", study.id)
+
+        # Add the DICOM image
+        logger.debug("Adding image to study: %s", image_reference)
+        image = self.hoppr.add_study_image(study.id, image_reference, image_data)
+        logger.debug("✓ Added image with ID: %s", image.id)
+
+        return study.id, image.id
+
+    def run_inference(
+        self,
+        study_id: str,
+        image_id: str,
+        model_id: str,
+        timeout: float = 180
+    ) -> Dict[str, Any]:
+        """
+        Run a Hoppr AI model on a study created by create_study_with_image.
+
+        Args:
+            study_id: ID of the study holding the image.
+            image_id: ID of the uploaded image.
+            model_id: The Hoppr model ID to use for inference.
+            timeout: Seconds to wait for the model before giving up.
+
+        Returns:
+            Dictionary containing the analysis results from the model.
+        """
+        try:
             # Run inference
-            print(f"Running inference with model: {model_id}")
+            logger.debug("Running inference with model: %s", model_id)
             response = self.hoppr.prompt_model(
-                study.id,
+                study_id,
                 model_id,
                 prompt="",
                 organization="hoppr",
-                response_format="json"
+                response_format="json",
+                timeout=timeout
             )
 
             if response:
-                print(f"✓ Inference successful: {response.success}")
+                logger.debug("✓ Inference successful: %s", response.success)
 
                 # Convert response to dictionary
                 if hasattr(response, "to_dict"):
@@ -96,31 +242,52 @@ class HopprModelInterface:
 
                 return {
                     "success": True,
-                    "study_id": study.id,
-                    "image_id": image.id,
+                    "study_id": study_id,
+                    "image_id": image_id,
                     "model_id": model_id,
                     "results": response_data
                 }
             else:
-                print("✗ Inference timed out")
+                logger.warning("✗ Inference timed out: %s", model_id)
                 return {
                     "success": False,
                     "error": "Inference timed out",
-                    "study_id": study.id,
-                    "image_id": image.id
+                    "timed_out": True,
+                    "study_id": study_id,
+                    "image_id": image_id
                 }
 
-        except FileNotFoundError:
-            return {
-                "success": False,
-                "error": f"DICOM file not found: {dicom_file_path}"
-            }
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e)
             }
 
+    def warm_up(self, connections: int = 1) -> None:
+        """
+        Open keep-alive connections to the Hoppr API ahead of the first request.
+
+        Failures are logged and ignored; the first real call then simply pays
+        the connection setup itself.
+
+        Args:
+            connections: Number of pooled connections to open concurrently.
+        """
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            futures = [
+                executor.submit(self._session.head, self.hoppr.base_url, timeout=10)
+                for _ in range(connections)
+            ]
+
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            logger.warning(
+                "Hoppr warm-up failed for %d of %d connection(s): %s",
+                len(errors), connections, errors[0]
+            )
+        else:
+            logger.debug("✓ Warmed up %d connection(s) to %s", connections, self.hoppr.base_url)
+
     def get_available_models(self) -> list:
         """
         Get list of available Hoppr models.
@@ -138,6 +305,8 @@ class HopprModelInterface:
 
 def main():
     """Example usage of the Hoppr model interface."""
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     # Initialize the model interface
     model = HopprModelInterface()
 
@@ -3,6 +3,9 @@ Utility functions for pathology detection and model selection.
 Maps pathology types to Hoppr AI models.
 """
 
+import re
+from typing import Optional
+
 # Map pathology names to Hoppr model IDs
 PATHOLOGY_TO_MODEL = {
     "atelectasis": "mc_chestradiography_atelectasis:v1.20250828",
@@ -21,33 +24,80 @@ PATHOLOGY_TO_MODEL = {
 }
 
 
-def detect_pathology_from_filename(filename: str) -> str:
+def _spellings(pathology_key: str) -> tuple:
+    """Underscore, space, hyphen and joined spellings of a pathology key"""
+    return tuple(dict.fromkeys((
+        pathology_key,
+        pathology_key.replace("_", " "),
+        pathology_key.replace("_", "-"),
+        pathology_key.replace("_", ""),
+    )))
+
+
+# Single compiled pattern for filename detection, built once at import.
+# Each pathology is a named group over its spellings; longer names come
+# first so they win at the same position. Names must stand as whole tokens
+# (bounded by "_", " ", "-", ".", digits or the ends of the name), so
+# "abnormal" is not read as "normal" nor "mild" as "ild".
+_PATHOLOGY_PATTERN = re.compile(
+    "(?<![a-z])(?:" + "|".join(
+        f"(?P<{pathology_key}>" + "|".join(
+            re.escape(variant)
+            for variant in sorted(_spellings(pathology_key), key=len, reverse=True)
+        ) + ")"
+        for pathology_key in sorted(PATHOLOGY_TO_MODEL, key=len, reverse=True)
+    ) + ")(?![a-z])",
+    re.IGNORECASE
+)
+
+# Every accepted spelling of a pathology (lowercased) mapped to its model ID,
+# so get_model_for_pathology is a single dict lookup
+_MODEL_BY_ALIAS = {
+    alias.lower(): model_id
+    for pathology_key, model_id in PATHOLOGY_TO_MODEL.items()
+    for alias in _spellings(pathology_key)
+}
+
+
+def detect_pathology_from_filename(
+    filename: str,
+    default: Optional[str] = "atelectasis"
+) -> Optional[str]:
     """
     Detect pathology type from DICOM filename or path.
 
     Args:
         filename: DICOM filename or path
+        default: Value returned when no pathology name is found; pass None
+            to tell "no hint" apart from a real match
 
     Returns:
         Detected pathology key (lowercase with underscores)
-    """
-    filename_lower = filename.lower()
-
-    # Check each pathology type
-    for pathology_key in PATHOLOGY_TO_MODEL.keys():
-        # Convert underscores to spaces for matching
-        pathology_variants = [
-            pathology_key,
-            pathology_key.replace("_", " "),
-            pathology_key.replace("_", ""),
-        ]
 
-        for variant in pathology_variants:
-            if variant in filename_lower:
-                return pathology_key
+    Examples:
+        >>> detect_pathology_from_filename("case_12_pleural-effusion.dcm")
+        'pleural_effusion'
+        >>> detect_pathology_from_filename("Cardiomegaly01.dcm")
+        'cardiomegaly'
+        >>> detect_pathology_from_filename("ild.dcm")
+        'ild'
+        >>> for name in ("abnormal_chest.dcm", "child_001.dcm",
+        ...              "mild_effusion.dcm", "build_7.dcm"):
+        ...     print(detect_pathology_from_filename(name, default=None))
+        None
+        None
+        None
+        None
+    """
+    # Prefer the longest name found, e.g. "pleural_effusion" over a shorter hit
+    match = max(
+        _PATHOLOGY_PATTERN.finditer(filename),
+        key=lambda m: m.end() - m.start(),
+        default=None
+    )
 
     # Default to atelectasis if not detected
-    return "atelectasis"
+    return match.lastgroup if match else default
 
 
 def get_model_for_pathology(pathology: str) -> str:
@@ -60,8 +110,7 @@ def get_model_for_pathology(pathology: str) -> str:
     Returns:
         Hoppr model ID string
     """
-    pathology_lower = pathology.lower().replace(" ", "_")
-    return PATHOLOGY_TO_MODEL.get(pathology_lower, PATHOLOGY_TO_MODEL["atelectasis"])
+    return _MODEL_BY_ALIAS.get(pathology.lower(), PATHOLOGY_TO_MODEL["atelectasis"])
 
 
 def get_all_models() -> list:
@@ -0,0 +1,8 @@
+"""
+WSGI entry point for production servers
+Run with: gunicorn -w 2 -k gthread --threads 16 -b 0.0.0.0:5001 wsgi:application
+"""
+
+from api_server import app
+
+application = app